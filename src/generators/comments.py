@@ -2,28 +2,37 @@
 Generate comments on tasks.
 """
 import sqlite3
-import random
-from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_timestamp_after
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Tuple
+from src.generators.tasks import TaskBatch
+from src.utils.db import insert_rows, transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.time_utils import random_timestamps_after, to_iso
 
+COMMENT_COLUMNS = ("comment_id", "task_id", "author_id", "body", "created_at")
 
-def generate_comments(conn: sqlite3.Connection, tasks: List[Dict], users: List[Dict],
-                     avg_comments_per_task: float = 1.5) -> List[Dict[str, str]]:
+
+def build_comment_rows(tasks: TaskBatch, users: List[Dict],
+                       avg_comments_per_task: float = 1.5, rng=RNG) -> Iterator[Tuple]:
     """
-    Generate comments for tasks and insert into database.
+    Build comment rows for tasks without touching the database.
+    
+    Rows are yielded in comment_id order: every task's comment count is drawn
+    up front, and the ids for all comments are generated and sorted before
+    the first row is built. The rows can then be streamed straight into
+    the comments B-tree without being collected and sorted first.
     
     Args:
-        conn: SQLite connection
-        tasks: List of task dictionaries
+        tasks: TaskBatch of generated tasks
         users: List of user dictionaries
         avg_comments_per_task: Average number of comments per task
+        rng: random.Random instance to draw from
     
-    Returns:
-        List of dictionaries with comment info (id, task_id, user_id, content)
+    Yields:
+        Comment row tuples, ready for insert_comments()
     """
-    cursor = conn.cursor()
-    comments = []
     
     # Realistic comment templates
     comment_templates = [
@@ -49,60 +58,66 @@ def generate_comments(conn: sqlite3.Connection, tasks: List[Dict], users: List[D
         "Merged PR, closing task.",
     ]
     
-    user_ids = [u['id'] for u in users]
-    user_names = {u['id']: f"{u['first_name']} {u['last_name']}" for u in users}
+    user_ids = tuple(u['id'] for u in users)
+    user_names = tuple(f"{u['first_name']} {u['last_name']}" for u in users)
     
-    for task in tasks:
-        task_id = task['id']
-        task_created_at = task['created_at']
-        
-        # Some tasks have no comments, some have many
-        # Use Poisson-like distribution
-        if random.random() < 0.3:
+    rand = rng.random
+    randint = rng.randint
+    choice = rng.choice
+    choices = rng.choices
+    
+    # Some tasks have no comments, some have many
+    # Use Poisson-like distribution
+    comment_counts = []
+    for _ in range(len(tasks)):
+        if rand() < 0.3:
             # No comments
-            num_comments = 0
-        elif random.random() < 0.7:
+            comment_counts.append(0)
+        elif rand() < 0.7:
             # 1-2 comments
-            num_comments = random.randint(1, 2)
+            comment_counts.append(randint(1, 2))
         else:
             # 3-8 comments
-            num_comments = random.randint(3, 8)
-        
-        # Track when last comment was made
-        last_comment_time = task_created_at
+            comment_counts.append(randint(3, 8))
+    
+    comment_ids = iter(sorted(generate_ids(sum(comment_counts), rng=rng)))
+    
+    for task_id, task_created_at, num_comments in zip(tasks.ids, tasks.created_ats, comment_counts):
+        # Pick authors, templates and timestamps for the whole thread at once.
+        # Comments are created after the previous comment.
+        comment_picks = zip(
+            islice(comment_ids, num_comments),
+            choices(user_ids, k=num_comments),
+            choices(comment_templates, k=num_comments),
+            random_timestamps_after(task_created_at, num_comments, max_days_later=15, sequential=True, rng=rng),
+        )
         
-        for i in range(num_comments):
-            comment_id = generate_id()
-            user_id = random.choice(user_ids)
-            
-            # Pick comment template
-            template = random.choice(comment_templates)
-            
+        for comment_id, user_id, template, created_at in comment_picks:
             # Fill in template placeholders
             if "{name}" in template:
-                random_name = random.choice(list(user_names.values()))
+                random_name = choice(user_names)
                 content = template.format(name=random_name)
             elif "{number}" in template:
-                content = template.format(number=random.randint(100, 999))
+                content = template.format(number=randint(100, 999))
             else:
                 content = template
             
-            # Comments are created after the previous comment
-            created_at = random_timestamp_after(last_comment_time, max_days_later=15)
-            last_comment_time = created_at
-            
-            cursor.execute("""
-                INSERT INTO comments (comment_id, task_id, author_id, body, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (comment_id, task_id, user_id, content, created_at))
-            
-            comments.append({
-                'id': comment_id,
-                'task_id': task_id,
-                'author_id': user_id,
-                'body': content
-            })
+            yield (comment_id, task_id, user_id, content, to_iso(created_at))
+
+
+def insert_comments(conn: sqlite3.Connection, comment_rows: Iterable[Tuple]) -> int:
+    """
+    Insert comment rows built by build_comment_rows() into database.
+    
+    Args:
+        conn: SQLite connection
+        comment_rows: Comment row tuples, already in comment_id order
+    
+    Returns:
+        Number of comments created
+    """
+    with transaction(conn) as cursor:
+        comments_created = insert_rows(cursor, "comments", COMMENT_COLUMNS, comment_rows)
     
-    conn.commit()
-    print(f"✓ Created {len(comments)} comment(s)")
-    return comments
+    echo(f"✓ Created {comments_created} comment(s)")
+    return comments_created
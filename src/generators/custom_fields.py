@@ -2,10 +2,34 @@
 Generate custom fields for projects.
 """
 import sqlite3
-import random
+from datetime import datetime
 from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import register_rng_functions, transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.sampling import floyd_sample
+from src.utils.time_utils import SECONDS_PER_DAY, random_past_timestamps, to_iso
+
+# Custom field templates
+FIELD_DEFINITIONS = (
+    {"name": "Story Points", "field_type": "number"},
+    {"name": "Sprint", "field_type": "text"},
+    {"name": "Epic", "field_type": "text"},
+    {"name": "Effort Estimate", "field_type": "number"},
+    {"name": "Department", "field_type": "text"},
+    {"name": "Severity", "field_type": "text"},
+    {"name": "Release Version", "field_type": "text"},
+    {"name": "Customer Impact", "field_type": "text"},
+    {"name": "Progress", "field_type": "number"},
+    {"name": "Cost Center", "field_type": "text"},
+)
+FIELD_COUNTS = (2, 3, 4)
+
+FIELD_INSERT_SQL = """
+    INSERT INTO custom_field_definitions (field_id, project_id, name, field_type, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
 
 
 def generate_custom_fields(conn: sqlite3.Connection, projects: List[Dict]) -> List[Dict[str, str]]:
@@ -19,41 +43,31 @@ def generate_custom_fields(conn: sqlite3.Connection, projects: List[Dict]) -> Li
     Returns:
         List of dictionaries with custom field info (id, name, field_type, project_id)
     """
-    cursor = conn.cursor()
     custom_fields = []
+    field_rows = []
     
-    # Custom field templates
-    field_definitions = [
-        {"name": "Story Points", "field_type": "number"},
-        {"name": "Sprint", "field_type": "text"},
-        {"name": "Epic", "field_type": "text"},
-        {"name": "Effort Estimate", "field_type": "number"},
-        {"name": "Department", "field_type": "text"},
-        {"name": "Severity", "field_type": "text"},
-        {"name": "Release Version", "field_type": "text"},
-        {"name": "Customer Impact", "field_type": "text"},
-        {"name": "Progress", "field_type": "number"},
-        {"name": "Cost Center", "field_type": "text"},
-    ]
+    # Draw every project's field count in one batch; each project has 2-4 custom fields
+    field_counts = RNG.choices(FIELD_COUNTS, k=len(projects))
     
-    for project in projects:
+    for project, num_fields in zip(projects, field_counts):
         project_id = project['id']
         
-        # Each project has 2-4 custom fields
-        num_fields = random.randint(2, 4)
-        selected_fields = random.sample(field_definitions, min(num_fields, len(field_definitions)))
+        selected_fields = [
+            FIELD_DEFINITIONS[i]
+            for i in floyd_sample(len(FIELD_DEFINITIONS), min(num_fields, len(FIELD_DEFINITIONS)))
+        ]
         
-        for field_def in selected_fields:
-            field_id = generate_id()
+        field_picks = zip(
+            generate_ids(len(selected_fields)),
+            selected_fields,
+            random_past_timestamps(len(selected_fields), days_ago_min=250, days_ago_max=50),
+        )
+        
+        for field_id, field_def, created_at in field_picks:
             name = field_def['name']
             field_type = field_def['field_type']
-            created_at = random_past_timestamp(days_ago_min=250, days_ago_max=50)
-            
-            cursor.execute("""
-                INSERT INTO custom_field_definitions (field_id, project_id, name, field_type, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (field_id, project_id, name, field_type, created_at))
             
+            field_rows.append((field_id, project_id, name, field_type, to_iso(created_at)))
             custom_fields.append({
                 'id': field_id,
                 'name': name,
@@ -61,27 +75,30 @@ def generate_custom_fields(conn: sqlite3.Connection, projects: List[Dict]) -> Li
                 'project_id': project_id
             })
     
-    conn.commit()
-    print(f"✓ Created {len(custom_fields)} custom field definition(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(FIELD_INSERT_SQL, field_rows)
+    
+    echo(f"✓ Created {len(custom_fields)} custom field definition(s)")
     return custom_fields
 
 
-def generate_custom_field_values(conn: sqlite3.Connection, custom_fields: List[Dict], 
-                                 tasks: List[Dict]) -> int:
+def generate_custom_field_values(conn: sqlite3.Connection, custom_fields: List[Dict], rng=RNG) -> int:
     """
     Generate custom field values for tasks.
     
+    The (task, field) cross product is filtered, valued and inserted by a
+    single INSERT ... SELECT. Its random draws come from rng through the
+    functions registered by register_rng_functions(), so the values, their
+    ids and which tasks get them are reproducible when the run is seeded.
+    
     Args:
         conn: SQLite connection
         custom_fields: List of custom field definition dictionaries
-        tasks: List of task dictionaries
+        rng: random.Random instance to draw from
     
     Returns:
         Number of custom field values created
     """
-    cursor = conn.cursor()
-    values_created = 0
-    
     # Value templates for different field types
     text_values = {
         "Sprint": ["Sprint 1", "Sprint 2", "Sprint 3", "Sprint 4", "Sprint 5"],
@@ -93,54 +110,88 @@ def generate_custom_field_values(conn: sqlite3.Connection, custom_fields: List[D
         "Cost Center": ["R&D", "Operations", "Sales", "Marketing"],
     }
     
-    # Group custom fields by project
-    fields_by_project = {}
+    # Candidate values for each field based on field type, numbered so that
+    # SQLite can pick one uniformly by offset
+    candidate_rows = []
     for field in custom_fields:
-        project_id = field['project_id']
-        if project_id not in fields_by_project:
-            fields_by_project[project_id] = []
-        fields_by_project[project_id].append(field)
+        field_type = field['field_type']
+        field_name = field['name']
+        
+        if field_type == "number":
+            if "Points" in field_name or "Estimate" in field_name:
+                candidates = ["1", "2", "3", "5", "8", "13"]
+            elif "Progress" in field_name:
+                candidates = [str(n) for n in range(0, 101)]
+            else:
+                candidates = [str(n) for n in range(1, 101)]
+        else:  # text
+            if field_name in text_values:
+                candidates = text_values[field_name]
+            else:
+                candidates = [f"Value {n}" for n in range(1, 6)]
+        
+        candidate_rows.extend(
+            (field['id'], position, value) for position, value in enumerate(candidates)
+        )
+    
+    register_rng_functions(conn, rng)
     
-    for task in tasks:
-        task_id = task['id']
-        project_id = task['project_id']
+    with transaction(conn) as cursor:
+        cursor.execute("""
+            CREATE TEMP TABLE field_value_candidates (
+                field_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (field_id, position)
+            ) WITHOUT ROWID
+        """)
+        cursor.executemany("""
+            INSERT INTO temp.field_value_candidates (field_id, position, value)
+            VALUES (?, ?, ?)
+        """, candidate_rows)
         
-        # Get custom fields for this task's project
-        project_fields = fields_by_project.get(project_id, [])
+        # 70% of tasks get a value for each of their project's custom fields;
+        # pick the position of each value among its field's candidates
+        cursor.execute("""
+            CREATE TEMP TABLE field_value_picks AS
+            SELECT
+                f.field_id,
+                t.task_id,
+                rng_randrange((
+                    SELECT COUNT(*) FROM temp.field_value_candidates c WHERE c.field_id = f.field_id
+                )) AS position
+            FROM tasks t
+            JOIN custom_field_definitions f ON f.project_id = t.project_id
+            WHERE rng_random() < 0.7
+        """)
         
-        for field in project_fields:
-            # 70% of tasks have values for custom fields
-            if random.random() > 0.7:
-                continue
-            
-            value_id = generate_id()
-            field_id = field['id']
-            field_type = field['field_type']
-            field_name = field['name']
-            
-            # Generate appropriate value based on field type
-            if field_type == "number":
-                if "Points" in field_name or "Estimate" in field_name:
-                    value = str(random.choice([1, 2, 3, 5, 8, 13]))
-                elif "Progress" in field_name:
-                    value = str(random.randint(0, 100))
-                else:
-                    value = str(random.randint(1, 100))
-            else:  # text
-                if field_name in text_values:
-                    value = random.choice(text_values[field_name])
-                else:
-                    value = f"Value {random.randint(1, 5)}"
-            
-            updated_at = random_past_timestamp(days_ago_min=150, days_ago_max=1)
-            
-            cursor.execute("""
-                INSERT INTO custom_field_values (value_id, field_id, task_id, value, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (value_id, field_id, task_id, value, updated_at))
-            
-            values_created += 1
+        # Values are updated 1-150 days ago. Whole seconds are subtracted from
+        # a Python timestamp, whose fraction is then appended, so updated_at
+        # has the same isoformat() text as every other timestamp column.
+        now = datetime.now()
+        cursor.execute("""
+            INSERT INTO custom_field_values (value_id, field_id, task_id, value, updated_at)
+            SELECT
+                rng_uuid4(),
+                p.field_id,
+                p.task_id,
+                c.value,
+                strftime('%Y-%m-%dT%H:%M:%S', :now,
+                         '-' || (:latest + rng_randrange(:window)) || ' seconds') || :fraction
+            FROM temp.field_value_picks p
+            JOIN temp.field_value_candidates c
+                ON c.field_id = p.field_id AND c.position = p.position
+            ORDER BY 1
+        """, {
+            'latest': 1 * SECONDS_PER_DAY,
+            'window': 150 * SECONDS_PER_DAY,
+            'now': now.replace(microsecond=0).isoformat(),
+            'fraction': now.isoformat()[19:],
+        })
+        values_created = cursor.rowcount
+        
+        cursor.execute("DROP TABLE temp.field_value_picks")
+        cursor.execute("DROP TABLE temp.field_value_candidates")
     
-    conn.commit()
-    print(f"✓ Created {values_created} custom field value(s)")
+    echo(f"✓ Created {values_created} custom field value(s)")
     return values_created
@@ -3,8 +3,15 @@ Generate organizations.
 """
 import sqlite3
 from typing import List
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.time_utils import random_past_timestamps, to_iso
+
+ORGANIZATION_INSERT_SQL = """
+    INSERT INTO organizations (organization_id, name, domain, created_at)
+    VALUES (?, ?, ?, ?)
+"""
 
 
 def generate_organizations(conn: sqlite3.Connection, count: int = 1) -> List[str]:
@@ -18,7 +25,6 @@ def generate_organizations(conn: sqlite3.Connection, count: int = 1) -> List[str
     Returns:
         List of created organization IDs
     """
-    cursor = conn.cursor()
     org_ids = []
     
     # Company names for B2B SaaS companies
@@ -39,19 +45,22 @@ def generate_organizations(conn: sqlite3.Connection, count: int = 1) -> List[str
         "innovatelabs.io",
     ]
     
-    for i in range(count):
-        org_id = generate_id()
+    org_picks = zip(
+        generate_ids(count),
+        random_past_timestamps(count, days_ago_min=730, days_ago_max=365),  # 1-2 years ago
+    )
+    
+    org_rows = []
+    
+    for i, (org_id, created_at) in enumerate(org_picks):
         name = company_names[i % len(company_names)] if i < len(company_names) else f"Company {i+1}"
         domain = company_domains[i % len(company_domains)] if i < len(company_domains) else f"company{i+1}.com"
-        created_at = random_past_timestamp(days_ago_min=730, days_ago_max=365)  # 1-2 years ago
-        
-        cursor.execute("""
-            INSERT INTO organizations (organization_id, name, domain, created_at)
-            VALUES (?, ?, ?, ?)
-        """, (org_id, name, domain, created_at))
         
+        org_rows.append((org_id, name, domain, to_iso(created_at)))
         org_ids.append(org_id)
     
-    conn.commit()
-    print(f"✓ Created {count} organization(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(ORGANIZATION_INSERT_SQL, org_rows)
+    
+    echo(f"✓ Created {count} organization(s)")
     return org_ids
@@ -2,13 +2,20 @@
 Generate projects for teams.
 """
 import sqlite3
-import random
 from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.time_utils import random_past_timestamps, to_iso
+
+PROJECT_INSERT_SQL = """
+    INSERT INTO projects (project_id, team_id, name, project_type, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
 
 
-def generate_projects(conn: sqlite3.Connection, teams: List[Dict], users: List[Dict], 
+def generate_projects(conn: sqlite3.Connection, teams: List[Dict], 
                      projects_per_team: int = 3) -> List[Dict[str, str]]:
     """
     Generate projects for teams and insert into database.
@@ -16,14 +23,13 @@ def generate_projects(conn: sqlite3.Connection, teams: List[Dict], users: List[D
     Args:
         conn: SQLite connection
         teams: List of team dictionaries
-        users: List of user dictionaries
         projects_per_team: Average number of projects per team
     
     Returns:
         List of dictionaries with project info (id, name, team_id, owner_id)
     """
-    cursor = conn.cursor()
     projects = []
+    project_rows = []
     
     # Project name templates
     project_templates = [
@@ -54,27 +60,25 @@ def generate_projects(conn: sqlite3.Connection, teams: List[Dict], users: List[D
     for team in teams:
         team_id = team['id']
         
-        num_projects = random.randint(max(1, projects_per_team - 1), projects_per_team + 2)
+        num_projects = RNG.randint(max(1, projects_per_team - 1), projects_per_team + 2)
         
-        for i in range(num_projects):
-            project_id = generate_id()
-            
+        project_picks = zip(
+            generate_ids(num_projects),
+            random_past_timestamps(num_projects, days_ago_min=300, days_ago_max=30),
+        )
+        
+        for project_id, created_at in project_picks:
             # Generate project name
-            template = random.choice(project_templates)
+            template = RNG.choice(project_templates)
             if "{}" in template:
-                filler = random.choice(quarters + years + descriptors)
+                filler = RNG.choice(quarters + years + descriptors)
                 name = template.format(filler)
             else:
                 name = template
             
-            project_type = random.choice(project_types)
-            created_at = random_past_timestamp(days_ago_min=300, days_ago_max=30)
-            
-            cursor.execute("""
-                INSERT INTO projects (project_id, team_id, name, project_type, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (project_id, team_id, name, project_type, created_at))
+            project_type = RNG.choice(project_types)
             
+            project_rows.append((project_id, team_id, name, project_type, to_iso(created_at)))
             projects.append({
                 'id': project_id,
                 'name': name,
@@ -82,6 +86,8 @@ def generate_projects(conn: sqlite3.Connection, teams: List[Dict], users: List[D
                 'project_type': project_type
             })
     
-    conn.commit()
-    print(f"✓ Created {len(projects)} project(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(PROJECT_INSERT_SQL, project_rows)
+    
+    echo(f"✓ Created {len(projects)} project(s)")
     return projects
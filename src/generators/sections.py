@@ -2,10 +2,34 @@
 Generate sections within projects.
 """
 import sqlite3
-import random
 from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+
+# Common section names in project management
+SECTION_NAMES = (
+    "To Do",
+    "In Progress",
+    "In Review",
+    "Done",
+    "Backlog",
+    "Blocked",
+    "Ready for Testing",
+    "Planning",
+    "Research",
+    "Design",
+    "Development",
+    "Testing",
+    "Deployment",
+)
+SECTION_COUNTS = (3, 4, 5, 6)
+
+SECTION_INSERT_SQL = """
+    INSERT INTO sections (section_id, project_id, name, position)
+    VALUES (?, ?, ?, ?)
+"""
 
 
 def generate_sections(conn: sqlite3.Connection, projects: List[Dict]) -> List[Dict[str, str]]:
@@ -19,47 +43,30 @@ def generate_sections(conn: sqlite3.Connection, projects: List[Dict]) -> List[Di
     Returns:
         List of dictionaries with section info (id, name, project_id)
     """
-    cursor = conn.cursor()
     sections = []
+    section_rows = []
     
-    # Common section names in project management
-    section_names = [
-        "To Do",
-        "In Progress",
-        "In Review",
-        "Done",
-        "Backlog",
-        "Blocked",
-        "Ready for Testing",
-        "Planning",
-        "Research",
-        "Design",
-        "Development",
-        "Testing",
-        "Deployment",
-    ]
+    # Draw every project's section count in one batch; each project gets 3-6 sections
+    section_counts = RNG.choices(SECTION_COUNTS, k=len(projects))
     
-    for project in projects:
+    for project, num_sections in zip(projects, section_counts):
         project_id = project['id']
         
-        # Each project gets 3-6 sections
-        num_sections = random.randint(3, 6)
-        project_sections = random.sample(section_names, min(num_sections, len(section_names)))
+        # Sample order becomes the board position of each section
+        project_sections = RNG.sample(SECTION_NAMES, min(num_sections, len(SECTION_NAMES)))
         
-        for position, section_name in enumerate(project_sections):
-            section_id = generate_id()
-            
-            cursor.execute("""
-                INSERT INTO sections (section_id, project_id, name, position)
-                VALUES (?, ?, ?, ?)
-            """, (section_id, project_id, section_name, position))
-            
+        section_ids = generate_ids(len(project_sections))
+        
+        for position, (section_id, section_name) in enumerate(zip(section_ids, project_sections)):
+            section_rows.append((section_id, project_id, section_name, position))
             sections.append({
                 'id': section_id,
                 'name': section_name,
                 'project_id': project_id
             })
     
-    conn.commit()
-    print(f"✓ Created {len(sections)} section(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(SECTION_INSERT_SQL, section_rows)
+    
+    echo(f"✓ Created {len(sections)} section(s)")
     return sections
@@ -2,28 +2,35 @@
 Generate subtasks for tasks.
 """
 import sqlite3
-import random
-from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_timestamp_after, maybe_completed_at
+from itertools import islice
+from typing import List, Tuple
+from src.generators.tasks import TaskBatch
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.time_utils import random_timestamps_after, maybe_completed_at, to_iso
+
+SUBTASK_INSERT_SQL = """
+    INSERT INTO subtasks (subtask_id, parent_task_id, assignee_id, name, completed, created_at, completed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
 
-def generate_subtasks(conn: sqlite3.Connection, tasks: List[Dict], 
-                      subtask_probability: float = 0.3) -> List[Dict[str, str]]:
+def build_subtask_rows(tasks: TaskBatch, subtask_probability: float = 0.3, rng=RNG) -> List[Tuple]:
     """
-    Generate subtasks for tasks and insert into database.
+    Build subtask rows for tasks without touching the database.
     Not all tasks have subtasks.
     
     Args:
-        conn: SQLite connection
-        tasks: List of task dictionaries
+        tasks: TaskBatch of generated tasks
         subtask_probability: Probability that a task has subtasks
+        rng: random.Random instance to draw from
     
     Returns:
-        List of dictionaries with subtask info (id, title, parent_task_id)
+        List of subtask row tuples, ready for insert_subtasks()
     """
-    cursor = conn.cursor()
-    subtasks = []
+    subtask_rows = []
     
     # Subtask title templates
     subtask_templates = [
@@ -44,27 +51,37 @@ def generate_subtasks(conn: sqlite3.Connection, tasks: List[Dict],
         "Update API docs",
     ]
     
-    for task in tasks:
+    rand = rng.random
+    randint = rng.randint
+    choices = rng.choices
+    
+    # Not all tasks have subtasks; those that do typically have 2-5.
+    # Counts are drawn up front so every subtask id comes from one batch.
+    subtask_counts = [
+        randint(2, 5) if rand() <= subtask_probability else 0
+        for _ in range(len(tasks))
+    ]
+    subtask_ids = iter(generate_ids(sum(subtask_counts), rng=rng))
+    
+    task_columns = zip(tasks.ids, tasks.created_ats, tasks.completed_ats, tasks.assignee_ids, subtask_counts)
+    
+    for task_id, task_created_at, task_completed_at, task_assignee_id, num_subtasks in task_columns:
         # Skip if task doesn't have subtasks
-        if random.random() > subtask_probability:
+        if not num_subtasks:
             continue
         
-        task_id = task['id']
-        task_created_at = task['created_at']
-        task_completed = task['completed_at'] is not None
+        task_completed = task_completed_at is not None
         
-        # Tasks with subtasks typically have 2-5 subtasks
-        num_subtasks = random.randint(2, 5)
+        # Subtasks are created after the parent task
+        subtask_picks = zip(
+            islice(subtask_ids, num_subtasks),
+            choices(subtask_templates, k=num_subtasks),
+            random_timestamps_after(task_created_at, num_subtasks, max_days_later=10, rng=rng),
+        )
         
-        for i in range(num_subtasks):
-            subtask_id = generate_id()
-            name = random.choice(subtask_templates)
-            
-            # Subtask created after parent task
-            created_at = random_timestamp_after(task_created_at, max_days_later=10)
-            
+        for subtask_id, name, created_at in subtask_picks:
             # Some subtasks have assignees (50% chance)
-            assignee_id = task.get('assignee_id') if random.random() < 0.5 else None
+            assignee_id = task_assignee_id if rand() < 0.5 else None
             
             # If parent task is completed, most subtasks should be completed too
             if task_completed:
@@ -72,20 +89,30 @@ def generate_subtasks(conn: sqlite3.Connection, tasks: List[Dict],
             else:
                 completion_rate = 0.5
             
-            completed_at = maybe_completed_at(created_at, completion_rate=completion_rate)
+            completed_at = maybe_completed_at(created_at, completion_rate=completion_rate, rng=rng)
             completed = 1 if completed_at else 0
             
-            cursor.execute("""
-                INSERT INTO subtasks (subtask_id, parent_task_id, assignee_id, name, completed, created_at, completed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (subtask_id, task_id, assignee_id, name, completed, created_at, completed_at))
-            
-            subtasks.append({
-                'id': subtask_id,
-                'name': name,
-                'parent_task_id': task_id
-            })
+            subtask_rows.append((subtask_id, task_id, assignee_id, name, completed,
+                                 to_iso(created_at), to_iso(completed_at)))
+    
+    return subtask_rows
+
+
+def insert_subtasks(conn: sqlite3.Connection, subtask_rows: List[Tuple]) -> int:
+    """
+    Insert subtask rows built by build_subtask_rows() into database.
+    
+    Args:
+        conn: SQLite connection
+        subtask_rows: List of subtask row tuples
+    
+    Returns:
+        Number of subtasks created
+    """
+    subtask_rows.sort()
+    
+    with transaction(conn) as cursor:
+        cursor.executemany(SUBTASK_INSERT_SQL, subtask_rows)
     
-    conn.commit()
-    print(f"✓ Created {len(subtasks)} subtask(s)")
-    return subtasks
+    echo(f"✓ Created {len(subtask_rows)} subtask(s)")
+    return len(subtask_rows)
@@ -2,9 +2,23 @@
 Generate tags for organization.
 """
 import sqlite3
-from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from typing import List, Dict, Tuple
+from src.generators.tasks import TaskBatch
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.sampling import floyd_sample
+from src.utils.time_utils import random_past_timestamps, to_iso
+
+TAG_INSERT_SQL = """
+    INSERT INTO tags (tag_id, name, created_at)
+    VALUES (?, ?, ?)
+"""
+TASK_TAG_INSERT_SQL = """
+    INSERT INTO task_tag_associations (task_id, tag_id, assigned_at)
+    VALUES (?, ?, ?)
+"""
 
 
 def generate_tags(conn: sqlite3.Connection, count: int = 15) -> List[Dict[str, str]]:
@@ -18,8 +32,8 @@ def generate_tags(conn: sqlite3.Connection, count: int = 15) -> List[Dict[str, s
     Returns:
         List of dictionaries with tag info (id, name)
     """
-    cursor = conn.cursor()
     tags = []
+    tag_rows = []
     
     # Common tags in project management
     tag_names = [
@@ -53,66 +67,74 @@ def generate_tags(conn: sqlite3.Connection, count: int = 15) -> List[Dict[str, s
     # Use only the specified count
     selected_tags = tag_names[:min(count, len(tag_names))]
     
-    for tag_name in selected_tags:
-        tag_id = generate_id()
-        created_at = random_past_timestamp(days_ago_min=365, days_ago_max=180)
-        
-        cursor.execute("""
-            INSERT INTO tags (tag_id, name, created_at)
-            VALUES (?, ?, ?)
-        """, (tag_id, tag_name, created_at))
-        
+    tag_picks = zip(
+        generate_ids(len(selected_tags)),
+        selected_tags,
+        random_past_timestamps(len(selected_tags), days_ago_min=365, days_ago_max=180),
+    )
+    
+    for tag_id, tag_name, created_at in tag_picks:
+        tag_rows.append((tag_id, tag_name, to_iso(created_at)))
         tags.append({
             'id': tag_id,
             'name': tag_name
         })
     
-    conn.commit()
-    print(f"✓ Created {len(tags)} tag(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(TAG_INSERT_SQL, tag_rows)
+    
+    echo(f"✓ Created {len(tags)} tag(s)")
     return tags
 
 
-def generate_task_tag_associations(conn: sqlite3.Connection, tasks: List[Dict], 
-                                   tags: List[Dict]) -> int:
+def build_task_tag_rows(tasks: TaskBatch, tags: List[Dict], rng=RNG) -> List[Tuple]:
     """
-    Generate associations between tasks and tags.
+    Build associations between tasks and tags without touching the database.
     
     Args:
-        conn: SQLite connection
-        tasks: List of task dictionaries
+        tasks: TaskBatch of generated tasks
         tags: List of tag dictionaries
+        rng: random.Random instance to draw from
     
     Returns:
-        Number of associations created
+        List of association row tuples, ready for insert_task_tag_associations()
     """
-    import random
-    
-    cursor = conn.cursor()
-    associations = 0
+    association_rows = []
     
     tag_ids = [t['id'] for t in tags]
     
-    for task in tasks:
-        task_id = task['id']
-        
-        # 60% of tasks have tags
-        if random.random() > 0.6:
-            continue
-        
-        # Tasks typically have 1-3 tags
-        num_tags = random.randint(1, 3)
-        selected_tags = random.sample(tag_ids, min(num_tags, len(tag_ids)))
-        
-        for tag_id in selected_tags:
-            assigned_at = random_past_timestamp(days_ago_min=150, days_ago_max=1)
-            
-            cursor.execute("""
-                INSERT INTO task_tag_associations (task_id, tag_id, assigned_at)
-                VALUES (?, ?, ?)
-            """, (task_id, tag_id, assigned_at))
-            
-            associations += 1
-    
-    conn.commit()
-    print(f"✓ Created {associations} task-tag association(s)")
+    # 60% of tasks have tags
+    rand = rng.random
+    tagged_task_ids = [task_id for task_id in tasks.ids if rand() <= 0.6]
+    
+    # Tasks typically have 1-3 tags
+    tag_counts = [min(n, len(tag_ids)) for n in rng.choices((1, 2, 3), k=len(tagged_task_ids))]
+    assigned_ats = iter(random_past_timestamps(sum(tag_counts), days_ago_min=150, days_ago_max=1, rng=rng))
+    
+    for task_id, num_tags in zip(tagged_task_ids, tag_counts):
+        # Tags are sampled without replacement: (task_id, tag_id) is the primary key
+        for tag_index in floyd_sample(len(tag_ids), num_tags, rng=rng):
+            association_rows.append((task_id, tag_ids[tag_index], to_iso(next(assigned_ats))))
+    
+    return association_rows
+
+
+def insert_task_tag_associations(conn: sqlite3.Connection, association_rows: List[Tuple]) -> int:
+    """
+    Insert association rows built by build_task_tag_rows() into database.
+    
+    Args:
+        conn: SQLite connection
+        association_rows: List of association row tuples
+    
+    Returns:
+        Number of associations created
+    """
+    association_rows.sort()
+    
+    with transaction(conn) as cursor:
+        cursor.executemany(TASK_TAG_INSERT_SQL, association_rows)
+    
+    associations = len(association_rows)
+    echo(f"✓ Created {associations} task-tag association(s)")
     return associations
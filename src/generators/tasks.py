@@ -2,14 +2,43 @@
 Generate tasks within sections/projects.
 """
 import sqlite3
-import random
-from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp, random_due_date, maybe_completed_at
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Optional
+from src.utils.db import insert_rows, transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.time_utils import random_past_timestamps, random_due_date, maybe_completed_at, to_iso
+
+TASK_COLUMNS = (
+    "task_id", "project_id", "section_id", "assignee_id", "name",
+    "description", "due_date", "completed", "created_at", "completed_at",
+)
+
+
+@dataclass
+class TaskBatch:
+    """
+    Generated tasks stored column-wise.
+    
+    Position i in every list describes the same task, so downstream
+    generators can zip the columns they need instead of doing a dict
+    lookup per field per task.
+    """
+    ids: List[str] = field(default_factory=list)
+    project_ids: List[str] = field(default_factory=list)
+    section_ids: List[str] = field(default_factory=list)
+    assignee_ids: List[Optional[str]] = field(default_factory=list)
+    created_ats: List[datetime] = field(default_factory=list)
+    completed_ats: List[Optional[datetime]] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
 
 
 def generate_tasks(conn: sqlite3.Connection, projects: List[Dict], sections: List[Dict], 
-                   users: List[Dict], tasks_per_project: int = 15) -> List[Dict[str, str]]:
+                   users: List[Dict], tasks_per_project: int = 15) -> TaskBatch:
     """
     Generate tasks for projects and insert into database.
     
@@ -21,10 +50,12 @@ def generate_tasks(conn: sqlite3.Connection, projects: List[Dict], sections: Lis
         tasks_per_project: Average number of tasks per project
     
     Returns:
-        List of dictionaries with task info (id, title, project_id, assignee_id, etc.)
+        TaskBatch with the created tasks' ids, project/section/assignee ids
+        and created/completed timestamps
     """
     cursor = conn.cursor()
-    tasks = []
+    tasks = TaskBatch()
+    task_rows = []
     
     # Task title templates
     task_templates = [
@@ -57,57 +88,74 @@ def generate_tasks(conn: sqlite3.Connection, projects: List[Dict], sections: Lis
         "integration", "permissions", "logging", "caching", "email system"
     ]
     
-    priorities = ["low", "medium", "high", "urgent"]
-    priority_weights = [2, 4, 3, 1]  # More medium/high tasks
+    # Group sections by project
+    sections_by_project = {}
+    for section in sections:
+        project_id = section['project_id']
+        if project_id not in sections_by_project:
+            sections_by_project[project_id] = []
+        sections_by_project[project_id].append(section)
+    
+    # Fetch the team members eligible for assignment in every project at once
+    cursor.execute("""
+        SELECT DISTINCT p.project_id, u.user_id
+        FROM projects p
+        JOIN teams t ON p.team_id = t.team_id
+        JOIN team_memberships tm ON t.team_id = tm.team_id
+        JOIN users u ON tm.user_id = u.user_id
+    """)
+    users_by_project = {}
+    for project_id, user_id in cursor.fetchall():
+        if project_id not in users_by_project:
+            users_by_project[project_id] = []
+        users_by_project[project_id].append(user_id)
+    
+    rand = RNG.random
+    randint = RNG.randint
+    choices = RNG.choices
     
     for project in projects:
         project_id = project['id']
         
         # Get sections for this project
-        project_sections = [s for s in sections if s['project_id'] == project_id]
+        project_sections = sections_by_project.get(project_id, [])
         if not project_sections:
             continue
         
         # Get team users for assignment
-        cursor.execute("""
-            SELECT DISTINCT u.user_id
-            FROM users u
-            JOIN team_memberships tm ON u.user_id = tm.user_id
-            JOIN teams t ON tm.team_id = t.team_id
-            JOIN projects p ON t.team_id = p.team_id
-            WHERE p.project_id = ?
-        """, (project_id,))
-        project_user_ids = [row[0] for row in cursor.fetchall()]
+        project_user_ids = users_by_project.get(project_id, [])
         
         if not project_user_ids:
             continue
         
-        num_tasks = random.randint(max(5, tasks_per_project - 5), tasks_per_project + 5)
+        num_tasks = randint(max(5, tasks_per_project - 5), tasks_per_project + 5)
         
-        for i in range(num_tasks):
-            task_id = generate_id()
-            
+        # Draw the per-task picks for the whole project in one batch each
+        task_picks = zip(
+            generate_ids(num_tasks),
+            choices(task_templates, k=num_tasks),
+            choices(components, k=num_tasks),
+            choices(project_sections, k=num_tasks),
+            choices(project_user_ids, k=num_tasks),
+            random_past_timestamps(num_tasks, days_ago_min=200, days_ago_max=1),
+        )
+        
+        for task_id, template, component, section, assignee_id, created_at in task_picks:
             # Generate task name
-            template = random.choice(task_templates)
-            component = random.choice(components)
             name = template.format(component)
             
             # Optional description for some tasks
-            description = f"Details for {name}" if random.random() < 0.3 else None
+            description = f"Details for {name}" if rand() < 0.3 else None
             
             # Random section
-            section_id = random.choice(project_sections)['id']
+            section_id = section['id']
             
             # 20% chance task is unassigned
-            if random.random() < 0.2:
+            if rand() < 0.2:
                 assignee_id = None
-            else:
-                assignee_id = random.choice(project_user_ids)
-            
-            created_at = random_past_timestamp(days_ago_min=200, days_ago_max=1)
             
             # 70% of tasks have due dates
-            if random.random() < 0.7:
+            if rand() < 0.7:
                 due_date = random_due_date(created_at, overdue_chance=0.2)
             else:
                 due_date = None
@@ -116,23 +164,19 @@ def generate_tasks(conn: sqlite3.Connection, projects: List[Dict], sections: Lis
             completed_at = maybe_completed_at(created_at, due_date, completion_rate=0.7)
             completed = 1 if completed_at else 0
             
-            cursor.execute("""
-                INSERT INTO tasks (task_id, project_id, section_id, assignee_id, name, 
-                                 description, due_date, completed, created_at, completed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (task_id, project_id, section_id, assignee_id, name, 
-                  description, due_date, completed, created_at, completed_at))
-            
-            tasks.append({
-                'id': task_id,
-                'name': name,
-                'project_id': project_id,
-                'section_id': section_id,
-                'assignee_id': assignee_id,
-                'created_at': created_at,
-                'completed_at': completed_at
-            })
+            task_rows.append((task_id, project_id, section_id, assignee_id, name, description,
+                              to_iso(due_date), completed, to_iso(created_at), to_iso(completed_at)))
+            tasks.ids.append(task_id)
+            tasks.project_ids.append(project_id)
+            tasks.section_ids.append(section_id)
+            tasks.assignee_ids.append(assignee_id)
+            tasks.created_ats.append(created_at)
+            tasks.completed_ats.append(completed_at)
+    
+    task_rows.sort()
+    
+    with transaction(conn) as cursor:
+        insert_rows(cursor, "tasks", TASK_COLUMNS, task_rows)
     
-    conn.commit()
-    print(f"✓ Created {len(tasks)} task(s)")
+    echo(f"✓ Created {len(tasks)} task(s)")
     return tasks
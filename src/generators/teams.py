@@ -3,8 +3,15 @@ Generate teams within organizations.
 """
 import sqlite3
 from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.time_utils import random_past_timestamps, to_iso
+
+TEAM_INSERT_SQL = """
+    INSERT INTO teams (team_id, organization_id, name, team_type, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
 
 
 def generate_teams(conn: sqlite3.Connection, org_id: str, count: int = 5) -> List[Dict[str, str]]:
@@ -19,8 +26,8 @@ def generate_teams(conn: sqlite3.Connection, org_id: str, count: int = 5) -> Lis
     Returns:
         List of dictionaries with team info (id, name, org_id)
     """
-    cursor = conn.cursor()
     teams = []
+    team_rows = []
     
     # Typical team names in a B2B SaaS company
     team_names = [
@@ -49,23 +56,24 @@ def generate_teams(conn: sqlite3.Connection, org_id: str, count: int = 5) -> Lis
         "legal",
     ]
     
-    for i in range(count):
-        team_id = generate_id()
+    team_picks = zip(
+        generate_ids(count),
+        random_past_timestamps(count, days_ago_min=365, days_ago_max=180),  # 6-12 months ago
+    )
+    
+    for i, (team_id, created_at) in enumerate(team_picks):
         name = team_names[i % len(team_names)]
         team_type = team_types[i % len(team_types)]
-        created_at = random_past_timestamp(days_ago_min=365, days_ago_max=180)  # 6-12 months ago
-        
-        cursor.execute("""
-            INSERT INTO teams (team_id, organization_id, name, team_type, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (team_id, org_id, name, team_type, created_at))
         
+        team_rows.append((team_id, org_id, name, team_type, to_iso(created_at)))
         teams.append({
             'id': team_id,
             'name': name,
             'org_id': org_id
         })
     
-    conn.commit()
-    print(f"✓ Created {count} team(s)")
+    with transaction(conn) as cursor:
+        cursor.executemany(TEAM_INSERT_SQL, team_rows)
+    
+    echo(f"✓ Created {count} team(s)")
     return teams
@@ -2,13 +2,52 @@
 Generate users within an organization.
 """
 import sqlite3
-import random
+from itertools import repeat
 from typing import List, Dict
-from src.utils.id_utils import generate_id
-from src.utils.time_utils import random_past_timestamp
+from src.utils.db import transaction
+from src.utils.id_utils import generate_ids
+from src.utils.logger import echo
+from src.utils.rng import RNG
+from src.utils.sampling import floyd_sample
+from src.utils.time_utils import random_past_timestamps, to_iso
 
+# Common first and last names for realistic user generation
+FIRST_NAMES = (
+    "Alice", "Bob", "Charlie", "Diana", "Ethan", "Fiona", "George", "Hannah",
+    "Ian", "Julia", "Kevin", "Laura", "Michael", "Nina", "Oliver", "Patricia",
+    "Quinn", "Rachel", "Steve", "Tara", "Uma", "Victor", "Wendy", "Xavier",
+    "Yara", "Zachary", "Amy", "Ben", "Claire", "David", "Emma", "Frank",
+    "Grace", "Henry", "Iris", "Jack", "Kate", "Liam", "Mia", "Nathan",
+    "Olivia", "Paul", "Rosa", "Sam", "Tina", "Ursula", "Vera", "Will", "Zoe"
+)
 
-def generate_users(conn: sqlite3.Connection, org_id: str, count: int = 50) -> List[Dict[str, str]]:
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Walker", "Hall",
+    "Allen", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams",
+    "Nelson", "Carter", "Mitchell", "Roberts", "Turner", "Phillips", "Campbell",
+    "Parker", "Evans", "Edwards", "Collins", "Stewart", "Morris", "Rogers", "Reed"
+)
+
+# Each name paired with its lowercase form for building email addresses
+FIRST_NAME_PAIRS = tuple((name, name.lower()) for name in FIRST_NAMES)
+LAST_NAME_PAIRS = tuple((name, name.lower()) for name in LAST_NAMES)
+
+ROLES = ("Engineer", "Manager", "Designer", "Analyst", "Coordinator", "Specialist", "Lead", "Director")
+
+USER_INSERT_SQL = """
+    INSERT INTO users (user_id, organization_id, first_name, last_name, email, role, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+MEMBERSHIP_INSERT_SQL = """
+    INSERT INTO team_memberships (membership_id, user_id, team_id, joined_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def generate_users(conn: sqlite3.Connection, org_id: str, team_ids: List[str],
+                   count: int = 50) -> List[Dict[str, str]]:
     """
     Generate users for an organization and insert into database.
     Also creates team_memberships to assign users to teams.
@@ -16,72 +55,58 @@ def generate_users(conn: sqlite3.Connection, org_id: str, count: int = 50) -> Li
     Args:
         conn: SQLite connection
         org_id: Organization ID
+        team_ids: IDs of the organization's teams to assign users to
         count: Number of users to create
     
     Returns:
         List of dictionaries with user info (id, name, email, org_id)
     """
-    cursor = conn.cursor()
-    users = []
+    # Draw names, roles, ids and timestamps for every user in one batch each
+    user_ids = generate_ids(count)
+    first_picks = RNG.choices(FIRST_NAME_PAIRS, k=count)
+    last_picks = RNG.choices(LAST_NAME_PAIRS, k=count)
+    roles = RNG.choices(ROLES, k=count)
+    created_ats = [to_iso(ts) for ts in random_past_timestamps(count, days_ago_min=365, days_ago_max=30)]
     
-    # Fetch existing teams for this organization
-    cursor.execute("SELECT team_id FROM teams WHERE organization_id = ?", (org_id,))
-    team_ids = [row[0] for row in cursor.fetchall()]
-    
-    # Common first and last names for realistic user generation
-    first_names = [
-        "Alice", "Bob", "Charlie", "Diana", "Ethan", "Fiona", "George", "Hannah",
-        "Ian", "Julia", "Kevin", "Laura", "Michael", "Nina", "Oliver", "Patricia",
-        "Quinn", "Rachel", "Steve", "Tara", "Uma", "Victor", "Wendy", "Xavier",
-        "Yara", "Zachary", "Amy", "Ben", "Claire", "David", "Emma", "Frank",
-        "Grace", "Henry", "Iris", "Jack", "Kate", "Liam", "Mia", "Nathan",
-        "Olivia", "Paul", "Rosa", "Sam", "Tina", "Ursula", "Vera", "Will", "Zoe"
+    # Build each user column with one comprehension instead of a per-user loop
+    first_names = [first_name for first_name, _ in first_picks]
+    last_names = [last_name for last_name, _ in last_picks]
+    emails = [
+        f"{first_lower}.{last_lower}@company.com"
+        for (_, first_lower), (_, last_lower) in zip(first_picks, last_picks)
     ]
     
-    last_names = [
-        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-        "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Walker", "Hall",
-        "Allen", "Young", "King", "Wright", "Scott", "Green", "Baker", "Adams",
-        "Nelson", "Carter", "Mitchell", "Roberts", "Turner", "Phillips", "Campbell",
-        "Parker", "Evans", "Edwards", "Collins", "Stewart", "Morris", "Rogers", "Reed"
-    ]
-    
-    roles = ["Engineer", "Manager", "Designer", "Analyst", "Coordinator", "Specialist", "Lead", "Director"]
-    
-    for i in range(count):
-        user_id = generate_id()
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        email = f"{first_name.lower()}.{last_name.lower()}@company.com"
-        role = random.choice(roles)
-        created_at = random_past_timestamp(days_ago_min=365, days_ago_max=30)
-        
-        cursor.execute("""
-            INSERT INTO users (user_id, organization_id, first_name, last_name, email, role, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (user_id, org_id, first_name, last_name, email, role, created_at))
-        
-        users.append({
+    user_rows = list(zip(user_ids, repeat(org_id, count), first_names, last_names, emails, roles, created_ats))
+    users = [
+        {
             'id': user_id,
             'first_name': first_name,
             'last_name': last_name,
             'email': email,
             'org_id': org_id
-        })
-        
-        # Assign user to 1-3 teams
-        if team_ids:
-            num_teams = random.randint(1, min(3, len(team_ids)))
-            assigned_teams = random.sample(team_ids, num_teams)
-            
-            for team_id in assigned_teams:
-                membership_id = generate_id()
-                cursor.execute("""
-                    INSERT INTO team_memberships (membership_id, user_id, team_id, joined_at)
-                    VALUES (?, ?, ?, ?)
-                """, (membership_id, user_id, team_id, created_at))
+        }
+        for user_id, first_name, last_name, email in zip(user_ids, first_names, last_names, emails)
+    ]
+    
+    # Each user joins 1-3 teams, on the day they are created
+    if team_ids:
+        team_counts = RNG.choices(range(1, min(3, len(team_ids)) + 1), k=count)
+    else:
+        team_counts = [0] * count
+    
+    memberships = [
+        (user_id, team_ids[team_index], created_at)
+        for user_id, created_at, num_teams in zip(user_ids, created_ats, team_counts)
+        for team_index in floyd_sample(len(team_ids), num_teams)
+    ]
+    membership_rows = [
+        (membership_id, *membership)
+        for membership_id, membership in zip(generate_ids(len(memberships)), memberships)
+    ]
+    
+    with transaction(conn) as cursor:
+        cursor.executemany(USER_INSERT_SQL, user_rows)
+        cursor.executemany(MEMBERSHIP_INSERT_SQL, membership_rows)
     
-    conn.commit()
-    print(f"✓ Created {count} user(s) with team memberships")
+    echo(f"✓ Created {count} user(s) with team memberships")
     return users
@@ -15,17 +15,21 @@ import sys
 from pathlib import Path
 
 from src.utils.config import get_config
-from src.utils.logger import setup_logging
-from src.utils.db import get_connection, initialize_schema
+from src.utils.logger import setup_logging, echo
+from src.utils.db import (
+    get_connection, initialize_schema, defer_foreign_keys, check_foreign_keys, save_database
+)
+from src.utils.parallel import get_executor
+from src.utils.rng import seed_rng, spawn_rng
 from src.generators.organizations import generate_organizations
 from src.generators.teams import generate_teams
 from src.generators.users import generate_users
 from src.generators.projects import generate_projects
 from src.generators.sections import generate_sections
 from src.generators.tasks import generate_tasks
-from src.generators.subtasks import generate_subtasks
-from src.generators.comments import generate_comments
-from src.generators.tags import generate_tags, generate_task_tag_associations
+from src.generators.subtasks import build_subtask_rows, insert_subtasks
+from src.generators.comments import build_comment_rows, insert_comments
+from src.generators.tags import generate_tags, build_task_tag_rows, insert_task_tag_associations
 from src.generators.custom_fields import generate_custom_fields, generate_custom_field_values
 
 
@@ -40,122 +44,146 @@ def main():
     
     # Load configuration
     config = get_config()
+    seed_rng(config.random_seed)
     
-    print("=" * 60)
-    print("Asana Seed Data Generator")
-    print("=" * 60)
-    print()
+    echo("=" * 60)
+    echo("Asana Seed Data Generator")
+    echo("=" * 60)
+    echo()
     
     try:
         # Step 1: Initialize database connection and schema
         logger.info("Initializing database...")
-        print("📦 Initializing database...")
-        conn = get_connection(config.db_output_path)
+        echo("📦 Initializing database...")
+        conn = get_connection(config.db_output_path, in_memory=config.db_in_memory)
         initialize_schema(conn)
+        defer_foreign_keys(conn)
         logger.info("Database initialized successfully")
-        print("✓ Database initialized with schema\n")
+        echo("✓ Database initialized with schema\n")
         
         # Step 2: Generate organizations
-        logger.info(f"Generating {config.organizations_count} organization(s)...")
-        print("🏢 Generating organizations...")
+        logger.info("Generating %d organization(s)...", config.organizations_count)
+        echo("🏢 Generating organizations...")
         org_ids = generate_organizations(conn, count=config.organizations_count)
         org_id = org_ids[0]
-        print()
+        echo()
         
         # Step 3: Generate teams
-        logger.info(f"Generating {config.teams_per_org} teams...")
-        print("👥 Generating teams...")
+        logger.info("Generating %d teams...", config.teams_per_org)
+        echo("👥 Generating teams...")
         teams = generate_teams(conn, org_id, count=config.teams_per_org)
-        print()
+        echo()
         
         # Step 4: Generate users (includes team_memberships)
-        logger.info(f"Generating {config.users_per_org} users...")
-        print("👤 Generating users...")
-        users = generate_users(conn, org_id, count=config.users_per_org)
-        print()
+        logger.info("Generating %d users...", config.users_per_org)
+        echo("👤 Generating users...")
+        users = generate_users(conn, org_id, [t['id'] for t in teams], count=config.users_per_org)
+        echo()
         
         # Step 5: Generate projects
-        logger.info(f"Generating projects ({config.projects_per_team} per team)...")
-        print("📋 Generating projects...")
-        projects = generate_projects(conn, teams, users, projects_per_team=config.projects_per_team)
-        print()
+        logger.info("Generating projects (%d per team)...", config.projects_per_team)
+        echo("📋 Generating projects...")
+        projects = generate_projects(conn, teams, projects_per_team=config.projects_per_team)
+        echo()
         
         # Step 6: Generate sections
         logger.info("Generating sections...")
-        print("📂 Generating sections...")
+        echo("📂 Generating sections...")
         sections = generate_sections(conn, projects)
-        print()
+        echo()
         
         # Step 7: Generate tasks
-        logger.info(f"Generating tasks ({config.tasks_per_project} per project)...")
-        print("✅ Generating tasks...")
+        logger.info("Generating tasks (%d per project)...", config.tasks_per_project)
+        echo("✅ Generating tasks...")
         tasks = generate_tasks(conn, projects, sections, users, tasks_per_project=config.tasks_per_project)
-        print()
+        echo()
         
-        # Step 8: Generate subtasks
-        logger.info("Generating subtasks...")
-        print("🔸 Generating subtasks...")
-        subtasks = generate_subtasks(conn, tasks, subtask_probability=config.getfloat('generation_probabilities', 'subtask_probability', 0.3))
-        print()
-        
-        # Step 9: Generate comments
-        logger.info("Generating comments...")
-        print("💬 Generating comments...")
-        comments = generate_comments(conn, tasks, users, avg_comments_per_task=1.5)
-        print()
-        
-        # Step 10: Generate tags
-        logger.info(f"Generating {config.tags_count} tags...")
-        print("🏷️  Generating tags...")
+        # Step 8: Generate tags
+        logger.info("Generating %d tags...", config.tags_count)
+        echo("🏷️  Generating tags...")
         tags = generate_tags(conn, count=config.tags_count)
-        print()
-        
-        # Step 11: Generate task-tag associations
-        logger.info("Generating task-tag associations...")
-        print("🔗 Generating task-tag associations...")
-        generate_task_tag_associations(conn, tasks, tags)
-        print()
-        
-        # Step 12: Generate custom field definitions
-        logger.info("Generating custom field definitions...")
-        print("⚙️  Generating custom field definitions...")
-        custom_fields = generate_custom_fields(conn, projects)
-        print()
+        echo()
+        
+        # Subtask, comment and task-tag rows depend only on the generated tasks,
+        # users and tags, so they are built by the executor (in worker processes
+        # when configured) while this process keeps writing to the database.
+        # Each builder draws from its own RNG, spawned in a fixed order, so a
+        # seeded run gives the same rows whatever the number of workers.
+        with get_executor(config.workers) as executor:
+            subtask_rows = executor.submit(build_subtask_rows, tasks, subtask_probability=config.subtask_probability,
+                                           rng=spawn_rng())
+            comment_rows = executor.submit(build_comment_rows, tasks, users, avg_comments_per_task=1.5,
+                                           rng=spawn_rng())
+            association_rows = executor.submit(build_task_tag_rows, tasks, tags, rng=spawn_rng())
+            
+            # Step 9: Generate custom field definitions
+            logger.info("Generating custom field definitions...")
+            echo("⚙️  Generating custom field definitions...")
+            custom_fields = generate_custom_fields(conn, projects)
+            echo()
+            
+            # Step 10: Generate subtasks
+            logger.info("Generating subtasks...")
+            echo("🔸 Generating subtasks...")
+            subtask_count = insert_subtasks(conn, subtask_rows.result())
+            echo()
+            
+            # Step 11: Generate comments
+            logger.info("Generating comments...")
+            echo("💬 Generating comments...")
+            comment_count = insert_comments(conn, comment_rows.result())
+            echo()
+            
+            # Step 12: Generate task-tag associations
+            logger.info("Generating task-tag associations...")
+            echo("🔗 Generating task-tag associations...")
+            insert_task_tag_associations(conn, association_rows.result())
+            echo()
         
         # Step 13: Generate custom field values
         logger.info("Generating custom field values...")
-        print("📊 Generating custom field values...")
-        generate_custom_field_values(conn, custom_fields, tasks)
-        print()
+        echo("📊 Generating custom field values...")
+        generate_custom_field_values(conn, custom_fields, rng=spawn_rng())
+        echo()
+        
+        # Check the foreign keys that were deferred during the load
+        logger.info("Checking foreign key integrity...")
+        check_foreign_keys(conn)
+        
+        if config.db_in_memory:
+            logger.info("Saving in-memory database...")
+            echo("💾 Saving database...")
+            save_database(conn, config.db_output_path)
+            echo()
         
         # Summary
-        print("=" * 60)
-        print("✨ Data generation complete!")
-        print("=" * 60)
-        print()
-        print("Summary:")
-        print(f"  • Organizations:       {len(org_ids)}")
-        print(f"  • Teams:               {len(teams)}")
-        print(f"  • Users:               {len(users)}")
-        print(f"  • Projects:            {len(projects)}")
-        print(f"  • Sections:            {len(sections)}")
-        print(f"  • Tasks:               {len(tasks)}")
-        print(f"  • Subtasks:            {len(subtasks)}")
-        print(f"  • Comments:            {len(comments)}")
-        print(f"  • Tags:                {len(tags)}")
-        print(f"  • Custom Fields:       {len(custom_fields)}")
-        print()
+        echo("=" * 60)
+        echo("✨ Data generation complete!")
+        echo("=" * 60)
+        echo()
+        echo("Summary:")
+        echo(f"  • Organizations:       {len(org_ids)}")
+        echo(f"  • Teams:               {len(teams)}")
+        echo(f"  • Users:               {len(users)}")
+        echo(f"  • Projects:            {len(projects)}")
+        echo(f"  • Sections:            {len(sections)}")
+        echo(f"  • Tasks:               {len(tasks)}")
+        echo(f"  • Subtasks:            {subtask_count}")
+        echo(f"  • Comments:            {comment_count}")
+        echo(f"  • Tags:                {len(tags)}")
+        echo(f"  • Custom Fields:       {len(custom_fields)}")
+        echo()
         
         # Database location
         project_root = Path(__file__).parent.parent
         db_path = project_root / config.db_output_path
-        print(f"📁 Database saved to: {db_path}")
-        print()
+        echo(f"📁 Database saved to: {db_path}")
+        echo()
         
         logger.info("Data generation completed successfully")
         
     except Exception as e:
-        logger.error(f"Error during data generation: {e}", exc_info=True)
+        logger.error("Error during data generation: %s", e, exc_info=True)
         print(f"\n❌ Error during data generation: {e}")
         import traceback
         traceback.print_exc()
@@ -166,7 +194,7 @@ def main():
         # Close connection
         conn.close()
     
-    print("✅ Done!")
+    echo("✅ Done!")
 
 
 if __name__ == "__main__":
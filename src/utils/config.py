@@ -29,11 +29,14 @@ class Config:
         else:
             # Use default values if config file not found
             self._set_defaults()
+        
+        self._load_values()
     
     def _set_defaults(self):
         """Set default configuration values"""
         self.config['database'] = {
-            'output_path': 'output/asana_simulation.sqlite'
+            'output_path': 'output/asana_simulation.sqlite',
+            'in_memory': 'false'
         }
         self.config['generation_counts'] = {
             'organizations': '1',
@@ -65,62 +68,64 @@ class Config:
             'task_created_days_ago_min': '200',
             'task_created_days_ago_max': '1'
         }
+        self.config['random'] = {
+            'seed': ''
+        }
+        self.config['performance'] = {
+            'workers': '1'
+        }
         self.config['logging'] = {
             'log_level': 'INFO',
             'log_to_file': 'false',
-            'log_file_path': 'logs/generator.log'
+            'log_file_path': 'logs/generator.log',
+            'quiet': 'false'
         }
     
-    def get(self, section: str, key: str, fallback: Any = None) -> str:
+    def _load_values(self):
+        """Parse the settings the pipeline uses once, into plain attributes"""
+        # Database
+        self.db_output_path = self.get('database', 'output_path', fallback='output/asana_simulation.sqlite')
+        self.db_in_memory = self.getboolean('database', 'in_memory', fallback=False)
+        
+        # Generation counts
+        self.organizations_count = self.getint('generation_counts', 'organizations', fallback=1)
+        self.teams_per_org = self.getint('generation_counts', 'teams_per_org', fallback=8)
+        self.users_per_org = self.getint('generation_counts', 'users_per_org', fallback=50)
+        self.projects_per_team = self.getint('generation_counts', 'projects_per_team', fallback=4)
+        self.tasks_per_project = self.getint('generation_counts', 'tasks_per_project', fallback=20)
+        self.tags_count = self.getint('generation_counts', 'tags_count', fallback=15)
+        
+        # Generation probabilities
+        self.subtask_probability = self.getfloat('generation_probabilities', 'subtask_probability', fallback=0.3)
+        
+        # Random seed; unset means a different dataset on every run
+        seed = self.get('random', 'seed', fallback='')
+        self.random_seed = int(seed) if seed.strip() else None
+        
+        # Performance
+        self.workers = self.getint('performance', 'workers', fallback=1)
+        
+        # Logging
+        self.log_level = self.get('logging', 'log_level', fallback='INFO')
+        self.log_to_file = self.getboolean('logging', 'log_to_file', fallback=False)
+        self.log_file_path = self.get('logging', 'log_file_path', fallback='logs/generator.log')
+        self.quiet = self.getboolean('logging', 'quiet', fallback=False)
+    
+    def get(self, section: str, key: str, *, fallback: Any = None) -> str:
         """Get a configuration value"""
         return self.config.get(section, key, fallback=fallback)
     
-    def getint(self, section: str, key: str, fallback: int = None) -> int:
+    def getint(self, section: str, key: str, *, fallback: int = None) -> int:
         """Get an integer configuration value"""
         return self.config.getint(section, key, fallback=fallback)
     
-    def getfloat(self, section: str, key: str, fallback: float = None) -> float:
+    def getfloat(self, section: str, key: str, *, fallback: float = None) -> float:
         """Get a float configuration value"""
         return self.config.getfloat(section, key, fallback=fallback)
     
-    def getboolean(self, section: str, key: str, fallback: bool = None) -> bool:
+    def getboolean(self, section: str, key: str, *, fallback: bool = None) -> bool:
         """Get a boolean configuration value"""
         return self.config.getboolean(section, key, fallback=fallback)
-    
-    @property
-    def db_output_path(self) -> str:
-        """Get the database output path"""
-        return self.get('database', 'output_path', 'output/asana_simulation.sqlite')
-    
-    @property
-    def organizations_count(self) -> int:
-        """Get number of organizations to generate"""
-        return self.getint('generation_counts', 'organizations', 1)
-    
-    @property
-    def teams_per_org(self) -> int:
-        """Get number of teams per organization"""
-        return self.getint('generation_counts', 'teams_per_org', 8)
-    
-    @property
-    def users_per_org(self) -> int:
-        """Get number of users per organization"""
-        return self.getint('generation_counts', 'users_per_org', 50)
-    
-    @property
-    def projects_per_team(self) -> int:
-        """Get number of projects per team"""
-        return self.getint('generation_counts', 'projects_per_team', 4)
-    
-    @property
-    def tasks_per_project(self) -> int:
-        """Get number of tasks per project"""
-        return self.getint('generation_counts', 'tasks_per_project', 20)
-    
-    @property
-    def tags_count(self) -> int:
-        """Get number of tags to create"""
-        return self.getint('generation_counts', 'tags_count', 15)
 
 
 # Global config instance
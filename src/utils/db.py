@@ -1,20 +1,81 @@
 """
 Database connection and initialization utilities.
+
+Generators insert the large tables in primary key order (sorting their rows
+first, or building them in key order). Each table's B-tree is then filled by
+appending to its last page instead of splitting pages at random positions.
 """
+import random
 import sqlite3
 import os
 import logging
+from contextlib import contextmanager, suppress
+from itertools import chain, islice
 from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+from src.utils.id_utils import generate_ids
 
 logger = logging.getLogger(__name__)
 
+# Bulk-load tuning applied to every new connection. The database is a
+# throwaway seed that is regenerated from scratch on each run, so a crash
+# mid-load only costs a rerun: the rollback journal is kept in memory, no
+# fsyncs are issued, and the file is locked for this connection alone.
+CONNECTION_PRAGMAS = [
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -64000",      # ~64 MB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped I/O
+]
+
+# Prepared statements kept per connection. Every generator reuses a fixed
+# INSERT string (insert_rows() at most two per table: full and final
+# chunk), so they all stay parsed for the whole run.
+STATEMENT_CACHE_SIZE = 256
+
+# Maximum number of bound parameters in one statement. SQLite builds older
+# than 3.32.0 default to 999.
+MAX_SQL_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Number of UUIDs generated at a time for the rng_uuid4() SQL function
+UUID_BLOCK_SIZE = 1024
+
 
-def get_connection(db_path: str = None) -> sqlite3.Connection:
+def _remove_database(db_path) -> None:
     """
-    Create and return a SQLite connection with foreign key constraints enabled.
+    Ensure the output directory exists and remove any existing database and
+    leftover journal files, so every run starts fresh.
+    
+    Args:
+        db_path: Path to the database file
+    """
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    
+    # Trying the remove is cheaper than checking first
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        with suppress(FileNotFoundError):
+            os.remove(f"{db_path}{suffix}")
+
+
+def get_connection(db_path: str = None, in_memory: bool = False) -> sqlite3.Connection:
+    """
+    Create and return a SQLite connection with foreign key constraints enabled
+    and the bulk-load PRAGMAs from CONNECTION_PRAGMAS applied.
+    
+    The connection runs in autocommit mode (isolation_level=None) so that
+    generators control transaction boundaries explicitly via transaction().
+    Type detection, row factories and statement tracing are all left off;
+    the generators only insert rows and read back plain tuples.
+    
+    With in_memory=True the database is built in memory and nothing is
+    written to db_path until save_database() is called.
     
     Args:
         db_path: Path to the database file. Defaults to output/asana_simulation.sqlite
+        in_memory: Whether to generate into an in-memory database
     
     Returns:
         sqlite3.Connection with foreign keys enabled
@@ -28,30 +89,61 @@ def get_connection(db_path: str = None) -> sqlite3.Connection:
         db_path = project_root / "output" / "asana_simulation.sqlite"
     
     try:
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        logger.info(f"Output directory ensured: {os.path.dirname(db_path)}")
-        
-        # Remove existing database to start fresh
-        if os.path.exists(db_path):
-            logger.info(f"Removing existing database: {db_path}")
-            os.remove(db_path)
+        if in_memory:
+            logger.info("Creating in-memory database for: %s", db_path)
+            database = ":memory:"
+        else:
+            _remove_database(db_path)
+            logger.info("Creating fresh database: %s", db_path)
+            database = db_path
         
         # Create connection
-        logger.info(f"Creating database connection: {db_path}")
-        conn = sqlite3.Connection(db_path)
+        conn = sqlite3.connect(database, detect_types=0, isolation_level=None,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = None
+        conn.set_trace_callback(None)
         
         # Enable foreign key constraints
         conn.execute("PRAGMA foreign_keys = ON")
         logger.info("Foreign key constraints enabled")
         
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        logger.info("Bulk-load PRAGMAs applied")
+        
         return conn
         
     except Exception as e:
-        logger.error(f"Failed to create database connection: {e}")
+        logger.error("Failed to create database connection: %s", e)
         raise Exception(f"Database connection error: {e}")
 
 
+def save_database(conn: sqlite3.Connection, db_path: str) -> None:
+    """
+    Write an in-memory database to db_path in one pass.
+    
+    Uses VACUUM INTO, which writes a compacted copy of the database without
+    a journal, falling back to the online backup API on SQLite builds older
+    than 3.27.0.
+    
+    Args:
+        conn: Connection returned by get_connection(in_memory=True)
+        db_path: Path to write the database file to
+    """
+    _remove_database(db_path)
+    
+    if sqlite3.sqlite_version_info >= (3, 27, 0):
+        conn.execute("VACUUM INTO ?", (str(db_path),))
+    else:
+        target = sqlite3.connect(db_path)
+        try:
+            conn.backup(target)
+        finally:
+            target.close()
+    
+    logger.info("In-memory database saved to: %s", db_path)
+
+
 def initialize_schema(conn: sqlite3.Connection, schema_path: str = None) -> None:
     """
     Initialize the database schema from schema.sql file.
@@ -71,10 +163,10 @@ def initialize_schema(conn: sqlite3.Connection, schema_path: str = None) -> None
     try:
         # Check if schema file exists
         if not os.path.exists(schema_path):
-            logger.error(f"Schema file not found: {schema_path}")
+            logger.error("Schema file not found: %s", schema_path)
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         
-        logger.info(f"Loading schema from: {schema_path}")
+        logger.info("Loading schema from: %s", schema_path)
         
         with open(schema_path, 'r') as f:
             schema_sql = f.read()
@@ -88,5 +180,128 @@ def initialize_schema(conn: sqlite3.Connection, schema_path: str = None) -> None
     except FileNotFoundError:
         raise
     except Exception as e:
-        logger.error(f"Failed to initialize schema: {e}")
+        logger.error("Failed to initialize schema: %s", e)
         raise Exception(f"Schema initialization error: {e}")
+
+
+def defer_foreign_keys(conn: sqlite3.Connection) -> None:
+    """
+    Stop enforcing foreign keys on each insert for the rest of the bulk load.
+    
+    Generators insert parents before children, so the constraints are
+    checked once at the end by check_foreign_keys() instead.
+    
+    Args:
+        conn: SQLite connection
+    """
+    conn.execute("PRAGMA foreign_keys = OFF")
+    logger.info("Foreign key enforcement deferred until the load completes")
+
+
+def check_foreign_keys(conn: sqlite3.Connection) -> None:
+    """
+    Re-enable foreign key constraints and check every row loaded while they
+    were deferred.
+    
+    Args:
+        conn: SQLite connection
+        
+    Raises:
+        sqlite3.IntegrityError: If any row references a missing parent
+    """
+    conn.execute("PRAGMA foreign_keys = ON")
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    if violations:
+        table, rowid, parent, _ = violations[0]
+        logger.error("Found %d foreign key violation(s)", len(violations))
+        raise sqlite3.IntegrityError(
+            f"{len(violations)} foreign key violation(s), "
+            f"first in {table} (rowid {rowid}) referencing {parent}"
+        )
+    logger.info("Foreign key constraints re-enabled and verified")
+
+
+def register_rng_functions(conn: sqlite3.Connection, rng: random.Random) -> None:
+    """
+    Expose a random number generator to SQL run on this connection.
+    
+    Statements that generate rows inside SQLite call these instead of its
+    built-in random() and randomblob(), which cannot be seeded:
+    
+    - rng_random(): float in [0.0, 1.0)
+    - rng_randrange(n): integer in [0, n)
+    - rng_uuid4(): UUIDv4 string, formatted like generate_ids()
+    
+    SQLite calls them once per row in scan order, so the results are
+    reproducible whenever rng is seeded.
+    
+    Args:
+        conn: SQLite connection
+        rng: random.Random instance to draw from
+    """
+    # UUIDs are drawn in blocks, which is much cheaper per id than one at a time
+    uuids = chain.from_iterable(iter(lambda: generate_ids(UUID_BLOCK_SIZE, rng=rng), None))
+    
+    conn.create_function("rng_random", 0, rng.random)
+    conn.create_function("rng_randrange", 1, rng.randrange)
+    conn.create_function("rng_uuid4", 0, uuids.__next__)
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    """
+    Run a block of writes inside a single explicit transaction.
+    
+    Issues BEGIN IMMEDIATE on entry and COMMIT on exit, or ROLLBACK if the
+    block raises, so a whole table can be loaded with one journal sync.
+    
+    Args:
+        conn: SQLite connection opened with isolation_level=None
+    
+    Yields:
+        Cursor to execute the inserts with
+    """
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        yield cursor
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        raise
+    cursor.execute("COMMIT")
+
+
+def insert_rows(cursor: sqlite3.Cursor, table: str, columns: Sequence[str],
+                rows: Iterable[tuple], rows_per_statement: int = 500) -> int:
+    """
+    Insert rows with multi-row INSERT ... VALUES (...), (...) statements.
+    
+    Rows are sent rows_per_statement at a time (fewer if a statement would
+    exceed MAX_SQL_VARIABLES), so SQLite runs one statement per chunk rather
+    than one per row as executemany does.
+    
+    Args:
+        cursor: Cursor to execute the inserts with
+        table: Name of the table to insert into
+        columns: Column names, in the order values appear in each row
+        rows: Iterable of row tuples
+        rows_per_statement: Maximum number of rows per INSERT statement
+    
+    Returns:
+        Number of rows inserted
+    """
+    rows_per_statement = max(1, min(rows_per_statement, MAX_SQL_VARIABLES // len(columns)))
+    row_placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+    insert_prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        chunk = list(islice(rows, rows_per_statement))
+        if not chunk:
+            break
+        sql = insert_prefix + ", ".join([row_placeholders] * len(chunk))
+        cursor.execute(sql, list(chain.from_iterable(chunk)))
+        inserted += len(chunk)
+    
+    return inserted
@@ -1,14 +1,55 @@
 """
 ID generation utilities.
+
+Every primary key in schema.sql is a TEXT column holding a UUIDv4, and the
+schema is fixed, so IDs stay UUID strings rather than integer surrogates.
+The cost of random TEXT keys is kept down elsewhere: the large tables are
+inserted in primary key order so their B-trees grow by appending.
 """
-import uuid
+from typing import List
+from src.utils.rng import RNG
+
+# The variant nibble of a UUIDv4 is 10xx in binary, indexed by a random hex digit
+VARIANT_DIGITS = "89ab" * 4
 
 
-def generate_id() -> str:
+def _format_uuid4s(raw: bytes) -> List[str]:
     """
-    Generate a UUIDv4 string for use as a primary key.
+    Format every 16 bytes of random data as a UUIDv4 string.
+    
+    Equivalent to str(uuid.UUID(bytes=..., version=4)) but works on one hex
+    string for the whole batch, writing the version and variant digits while
+    the dashes are sliced in, without building UUID objects.
+    
+    Args:
+        raw: Random bytes, a multiple of 16 long
     
     Returns:
-        String representation of UUIDv4
+        List of UUIDv4 string representations
+    """
+    h = raw.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-"
+        f"{VARIANT_DIGITS[int(h[i + 16], 16)]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    ]
+
+
+def generate_ids(count: int, rng=RNG) -> List[str]:
     """
-    return str(uuid.uuid4())
+    Generate a batch of UUIDv4 strings from a single draw of random bits.
+    
+    The bits come from the shared RNG by default, so IDs are reproducible
+    when the run is seeded.
+    
+    Args:
+        count: Number of IDs to generate
+        rng: random.Random instance to draw from
+    
+    Returns:
+        List of UUIDv4 string representations
+    """
+    if count <= 0:
+        return []
+    
+    return _format_uuid4s(rng.getrandbits(128 * count).to_bytes(16 * count, 'big'))
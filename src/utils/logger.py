@@ -15,8 +15,7 @@ def setup_logging():
     config = get_config()
     
     # Get log level from config
-    log_level_str = config.get('logging', 'log_level', 'INFO')
-    log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+    log_level = getattr(logging, config.log_level.upper(), logging.INFO)
     
     # Configure root logger
     logger = logging.getLogger()
@@ -33,8 +32,8 @@ def setup_logging():
     logger.addHandler(console_handler)
     
     # File handler if enabled
-    if config.getboolean('logging', 'log_to_file', False):
-        log_file = config.get('logging', 'log_file_path', 'logs/generator.log')
+    if config.log_to_file:
+        log_file = config.log_file_path
         
         # Create logs directory if it doesn't exist
         log_dir = Path(log_file).parent
@@ -62,3 +61,17 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     return logging.getLogger(name)
+
+
+def echo(message: str = "") -> None:
+    """
+    Print a progress message to the console unless quiet is set in config.ini.
+    
+    Progress output is kept separate from logging so that log records are
+    not written twice when stdout is redirected alongside the log file.
+    
+    Args:
+        message: Message to print
+    """
+    if not get_config().quiet:
+        print(message)
@@ -0,0 +1,50 @@
+"""
+Executors for building generator rows outside the main process.
+"""
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+
+class InlineExecutor(Executor):
+    """Executor that runs each submitted call immediately in the calling process"""
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class RowBuilderPool(ProcessPoolExecutor):
+    """Process pool that collects lazily built rows in the worker so they can be sent back"""
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        return super().submit(_collect_rows, fn, *args, **kwargs)
+
+
+def _collect_rows(fn, *args, **kwargs) -> list:
+    """Call a row builder and materialize its rows in the worker; generators cannot be pickled"""
+    return list(fn(*args, **kwargs))
+
+
+def get_executor(workers: int = 1) -> Executor:
+    """
+    Get an executor for row-building work.
+    
+    Row builders only do Python computation, so with more than one worker
+    they run in separate processes while the main process keeps writing to
+    the single SQLite connection. Inline, a builder that yields its rows is
+    streamed straight into its insert. Builders should be given their own
+    random.Random (see spawn_rng()) so their output does not depend on
+    where or when they run.
+    
+    Args:
+        workers: Number of worker processes. 1 or less runs everything inline.
+    
+    Returns:
+        Executor to submit row builders to
+    """
+    if workers <= 1:
+        return InlineExecutor()
+    return RowBuilderPool(max_workers=workers)
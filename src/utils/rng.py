@@ -0,0 +1,39 @@
+"""
+Shared random number generator for the Asana seed data generator.
+
+Generators that draw for every row bind the generator's methods (random,
+randint, choices, ...) to local names before their loops, saving an
+attribute lookup per call.
+"""
+import random
+from typing import Optional
+
+# Every generator and utility draws from this one instance instead of the
+# random module's hidden global one, so a whole run can be reproduced by
+# seeding it once with seed_rng()
+RNG = random.Random()
+
+
+def seed_rng(seed: Optional[int] = None) -> None:
+    """
+    Seed the shared random number generator.
+    
+    Args:
+        seed: Seed value. None seeds from OS entropy, giving a different
+            dataset on every run.
+    """
+    RNG.seed(seed)
+
+
+def spawn_rng() -> random.Random:
+    """
+    Create an independent random number generator seeded from the shared one.
+    
+    Row builders that may run in worker processes each get their own
+    generator, spawned in a fixed order, so a seeded run produces the same
+    data however many workers build the rows and in whatever order they run.
+    
+    Returns:
+        New random.Random instance
+    """
+    return random.Random(RNG.getrandbits(64))
@@ -0,0 +1,30 @@
+"""
+Sampling utilities for picking small subsets without replacement.
+"""
+from typing import List
+from src.utils.rng import RNG
+
+
+def floyd_sample(n: int, k: int, rng=RNG) -> List[int]:
+    """
+    Pick k distinct indices from range(n) with Floyd's algorithm.
+    
+    Only k random draws are made regardless of n. The order of the returned
+    indices is not random, so use random.sample() where order matters
+    (e.g. section positions).
+    
+    Args:
+        n: Size of the population
+        k: Number of indices to pick (at most n)
+        rng: random.Random instance to draw from
+    
+    Returns:
+        List of k distinct indices in range(n)
+    """
+    rand = rng.random
+    selected = set()
+    for j in range(n - k, n):
+        # Same floor(random() * n) scaling that random.choices() uses
+        t = int(rand() * (j + 1))
+        selected.add(j if t in selected else t)
+    return list(selected)
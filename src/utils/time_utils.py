@@ -1,11 +1,33 @@
 """
 Time and timestamp generation utilities.
 """
-from datetime import datetime, timedelta
-import random
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import List, Optional, Union
+from src.utils.rng import RNG
 
+SECONDS_PER_DAY = 24 * 60 * 60
 
-def random_past_timestamp(days_ago_min: int = 365, days_ago_max: int = 1) -> str:
+
+def to_iso(value: Optional[Union[date, datetime]]) -> Optional[str]:
+    """
+    Format a generated date or timestamp for insertion into the database.
+    
+    Generators pass datetime objects between each other and only format
+    them here, once per row, as the row is built for insertion.
+    
+    Args:
+        value: datetime, date, or None
+    
+    Returns:
+        ISO 8601 formatted string, or None if value is None
+    """
+    if value is None:
+        return None
+    return value.isoformat()
+
+
+def random_past_timestamp(days_ago_min: int = 365, days_ago_max: int = 1) -> datetime:
     """
     Generate a random timestamp in the past.
     
@@ -14,92 +36,133 @@ def random_past_timestamp(days_ago_min: int = 365, days_ago_max: int = 1) -> str
         days_ago_max: Maximum days in the past (most recent)
     
     Returns:
-        ISO 8601 formatted timestamp string
+        Timestamp as a datetime
     """
-    days_ago = random.randint(days_ago_max, days_ago_min)
-    hours = random.randint(0, 23)
-    minutes = random.randint(0, 59)
-    seconds = random.randint(0, 59)
+    # One draw over whole seconds: the same as independent uniform days,
+    # hours, minutes and seconds, without four randint() calls
+    seconds_ago = RNG.randrange(days_ago_max * SECONDS_PER_DAY, (days_ago_min + 1) * SECONDS_PER_DAY)
     
-    timestamp = datetime.now() - timedelta(days=days_ago, hours=hours, minutes=minutes, seconds=seconds)
-    return timestamp.isoformat()
+    return datetime.now() - timedelta(seconds=seconds_ago)
 
 
-def random_timestamp_after(after: str, max_days_later: int = 30) -> str:
+def random_past_timestamps(count: int, days_ago_min: int = 365, days_ago_max: int = 1,
+                           rng=RNG) -> List[datetime]:
+    """
+    Generate several random timestamps in the past in one pass.
+    
+    Reads the clock once and draws each offset as a single number of seconds
+    from the same window as random_past_timestamp().
+    
+    Args:
+        count: Number of timestamps to generate
+        days_ago_min: Minimum days in the past
+        days_ago_max: Maximum days in the past (most recent)
+        rng: random.Random instance to draw from
+    
+    Returns:
+        List of timestamps as datetimes
+    """
+    now = datetime.now()
+    earliest = (days_ago_min + 1) * SECONDS_PER_DAY
+    latest = days_ago_max * SECONDS_PER_DAY
+    randrange = rng.randrange
+    
+    return [now - timedelta(seconds=randrange(latest, earliest)) for _ in range(count)]
+
+
+def random_timestamp_after(after: datetime, max_days_later: int = 30) -> datetime:
     """
     Generate a random timestamp after a given timestamp.
     
     Args:
-        after: ISO 8601 timestamp string
+        after: Timestamp to start from
         max_days_later: Maximum days after the given timestamp
     
     Returns:
-        ISO 8601 formatted timestamp string
+        Timestamp as a datetime
+    """
+    seconds_later = RNG.randrange((max_days_later + 1) * SECONDS_PER_DAY)
+    
+    return after + timedelta(seconds=seconds_later)
+
+
+def random_timestamps_after(after: datetime, count: int, max_days_later: int = 30,
+                            sequential: bool = False, rng=RNG) -> List[datetime]:
+    """
+    Generate several random timestamps after a given timestamp in one pass.
+    
+    Each offset is drawn from the same window as random_timestamp_after().
+    With sequential=True the offsets accumulate, so every timestamp follows
+    the previous one as if random_timestamp_after() were chained.
+    
+    Args:
+        after: Timestamp to start from
+        count: Number of timestamps to generate
+        max_days_later: Maximum days after the given (or previous) timestamp
+        sequential: Whether each timestamp is measured from the previous one
+        rng: random.Random instance to draw from
+    
+    Returns:
+        List of timestamps as datetimes
     """
-    start = datetime.fromisoformat(after)
-    days_later = random.randint(0, max_days_later)
-    hours = random.randint(0, 23)
-    minutes = random.randint(0, 59)
-    seconds = random.randint(0, 59)
-    
-    timestamp = start + timedelta(days=days_later, hours=hours, minutes=minutes, seconds=seconds)
-    return timestamp.isoformat()
+    window = (max_days_later + 1) * SECONDS_PER_DAY
+    randrange = rng.randrange
+    
+    offsets = [randrange(window) for _ in range(count)]
+    if sequential:
+        offsets = accumulate(offsets)
+    
+    return [after + timedelta(seconds=offset) for offset in offsets]
 
 
-def random_due_date(created_at: str, overdue_chance: float = 0.2) -> str:
+def random_due_date(created_at: datetime, overdue_chance: float = 0.2) -> date:
     """
     Generate a random due date relative to creation date.
     May be in the past (overdue) based on overdue_chance.
     
     Args:
-        created_at: ISO 8601 timestamp string of task creation
+        created_at: Timestamp of task creation
         overdue_chance: Probability (0-1) that the task is overdue
     
     Returns:
-        ISO 8601 formatted date string (date only, no time)
+        Due date (date only, no time)
     """
-    start = datetime.fromisoformat(created_at)
-    
-    if random.random() < overdue_chance:
+    if RNG.random() < overdue_chance:
         # Make it overdue: due date is before today
-        days_until_due = random.randint(-30, -1)
+        days_until_due = RNG.randrange(-30, 0)
     else:
         # Not overdue: due date is in the future or today
-        days_until_due = random.randint(1, 60)
+        days_until_due = RNG.randrange(1, 61)
     
-    due_date = start + timedelta(days=days_until_due)
-    return due_date.date().isoformat()
+    return (created_at + timedelta(days=days_until_due)).date()
 
 
-def maybe_completed_at(created_at: str, due_date: str = None, completion_rate: float = 0.7) -> str:
+def maybe_completed_at(created_at: datetime, due_date: Optional[date] = None,
+                       completion_rate: float = 0.7, rng=RNG) -> Optional[datetime]:
     """
     Generate a completion timestamp or None based on completion rate.
     If completed, ensures completed_at > created_at.
     
     Args:
-        created_at: ISO 8601 timestamp string
-        due_date: Optional due date (ISO format)
+        created_at: Timestamp of creation
+        due_date: Optional due date
         completion_rate: Probability (0-1) that task is completed
+        rng: random.Random instance to draw from
     
     Returns:
-        ISO 8601 timestamp string or None
+        Completion timestamp as a datetime, or None
     """
-    if random.random() > completion_rate:
+    if rng.random() > completion_rate:
         return None
     
     # Task is completed
-    start = datetime.fromisoformat(created_at)
-    
     if due_date:
         # Complete within reasonable time after creation, possibly after due date
         max_days = 90
     else:
         max_days = 60
     
-    days_later = random.randint(1, max_days)
-    hours = random.randint(0, 23)
-    minutes = random.randint(0, 59)
-    seconds = random.randint(0, 59)
+    # At least one day, at most max_days days and 23:59:59 later
+    seconds_later = rng.randrange(SECONDS_PER_DAY, (max_days + 1) * SECONDS_PER_DAY)
     
-    completed = start + timedelta(days=days_later, hours=hours, minutes=minutes, seconds=seconds)
-    return completed.isoformat()
+    return created_at + timedelta(seconds=seconds_later)
@@ -0,0 +1,142 @@
+"""
+Verify the integrity of a generated Asana seed database.
+
+Usage:
+    python verify.py
+
+Checks foreign key integrity, temporal consistency, data distributions and
+record counts. Each group of checks is a single aggregate query, so the
+whole verification is a handful of round-trips regardless of database size.
+Exits with status 1 if any integrity check fails.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+from src.utils.config import get_config
+
+# Tables reported in the record counts, in generation order
+TABLES = (
+    "organizations",
+    "teams",
+    "users",
+    "team_memberships",
+    "projects",
+    "sections",
+    "tasks",
+    "subtasks",
+    "comments",
+    "tags",
+    "task_tag_associations",
+    "custom_field_definitions",
+    "custom_field_values",
+)
+
+COUNTS_SQL = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in TABLES)
+
+# Every temporal rule as one column; each value is the number of violating rows
+TEMPORAL_CHECKS = (
+    ("Tasks completed before they were created", "SELECT COUNT(*) FROM tasks WHERE completed_at <= created_at"),
+    ("Subtasks completed before they were created", "SELECT COUNT(*) FROM subtasks WHERE completed_at <= created_at"),
+    ("Subtasks created before their parent task", """
+        SELECT COUNT(*) FROM subtasks s JOIN tasks t ON s.parent_task_id = t.task_id
+        WHERE s.created_at < t.created_at
+    """),
+    ("Comments created before their task", """
+        SELECT COUNT(*) FROM comments c JOIN tasks t ON c.task_id = t.task_id
+        WHERE c.created_at < t.created_at
+    """),
+    ("Tasks whose completed flag disagrees with completed_at",
+     "SELECT COUNT(*) FROM tasks WHERE completed != (completed_at IS NOT NULL)"),
+    ("Subtasks whose completed flag disagrees with completed_at",
+     "SELECT COUNT(*) FROM subtasks WHERE completed != (completed_at IS NOT NULL)"),
+)
+
+TEMPORAL_SQL = "SELECT " + ", ".join(f"({sql.strip()})" for _, sql in TEMPORAL_CHECKS)
+
+# Task distributions in a single pass over the tasks table
+DISTRIBUTION_SQL = """
+    SELECT
+        AVG(assignee_id IS NULL),
+        AVG(completed),
+        AVG(due_date IS NOT NULL),
+        AVG(CASE WHEN due_date IS NOT NULL THEN completed = 0 AND due_date < date('now', 'localtime') END),
+        AVG(description IS NOT NULL)
+    FROM tasks
+"""
+
+
+def main():
+    """
+    Run all verification checks against the database configured in config.ini.
+    """
+    config = get_config()
+    project_root = Path(__file__).parent
+    db_path = project_root / config.db_output_path
+    
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        print("   Run `python3 -m src.main` first.")
+        sys.exit(1)
+    
+    # Open read-only: get_connection() would delete the database to start fresh
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    failures = 0
+    
+    print("=" * 60)
+    print("Asana Seed Data Verification")
+    print("=" * 60)
+    print()
+    
+    try:
+        # Foreign key integrity
+        print("🔗 Foreign key integrity")
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            failures += 1
+            print(f"  ❌ {len(violations)} foreign key violation(s), e.g. {violations[0]}")
+        else:
+            print("  ✓ No foreign key violations")
+        print()
+        
+        # Temporal consistency
+        print("⏱️  Temporal consistency")
+        temporal = conn.execute(TEMPORAL_SQL).fetchone()
+        for (description, _), violating in zip(TEMPORAL_CHECKS, temporal):
+            if violating:
+                failures += 1
+                print(f"  ❌ {description}: {violating}")
+            else:
+                print(f"  ✓ {description}: none")
+        print()
+        
+        # Data distributions
+        print("📊 Task distributions")
+        unassigned, completed, has_due_date, overdue, has_description = (
+            value or 0.0 for value in conn.execute(DISTRIBUTION_SQL).fetchone()
+        )
+        print(f"  • Unassigned:          {unassigned:.1%}")
+        print(f"  • Completed:           {completed:.1%}")
+        print(f"  • With due date:       {has_due_date:.1%}")
+        print(f"  • Overdue (of due):    {overdue:.1%}")
+        print(f"  • With description:    {has_description:.1%}")
+        print()
+        
+        # Record counts
+        print("📋 Record counts")
+        for table, count in zip(TABLES, conn.execute(COUNTS_SQL).fetchone()):
+            print(f"  • {table + ':':<26} {count}")
+        print()
+    
+    finally:
+        conn.close()
+    
+    if failures:
+        print(f"❌ Verification failed: {failures} check(s) did not pass")
+        sys.exit(1)
+    
+    print("✅ All checks passed!")
+
+
+if __name__ == "__main__":
+    main()